@@ -0,0 +1,20 @@
+"""Entry point for ``python -m html2md`` and the ``html2md`` console script."""
+
+import sys
+
+
+def main():
+    """Run the CLI, answering a bare --version without loading Click."""
+    if len(sys.argv) == 2 and sys.argv[1] in ("--version", "-V"):
+        from . import __version__
+
+        print(f"html2md, version {__version__}")
+        sys.exit(0)
+
+    from .cli import main as cli_main
+
+    cli_main(prog_name="html2md")
+
+
+if __name__ == "__main__":
+    main()
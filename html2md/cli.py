@@ -1,23 +1,58 @@
 """Main CLI interface for html2md."""
 
+import os
 import sys
 from pathlib import Path
-from typing import Optional, Literal, cast
+from typing import TYPE_CHECKING, Iterable, Optional, Literal, cast
 
 import click
-from colorama import Fore, Style, init
-from tqdm import tqdm
 
 from . import __version__
-from .converter import HTMLToMarkdownConverter
-from .processor import ConflictResolver, FileProcessor
 
-# Initialize colorama for Windows
-init(autoreset=True)
+if TYPE_CHECKING:
+    from .processor import FileProcessor
+
+# colorama, tqdm and the converter stack are imported lazily so that
+# --help, --version and the banner do not pay for them.
+_colors = None
+
+# Status-line prefixes, built once by _init_colors()
+_OK = _ERR = _WARN = _INFO = ""
+
+
+def _init_colors():
+    """Import and initialize colorama on first use.
+
+    Returns:
+        Tuple of colorama's (Fore, Style) namespaces
+    """
+    global _colors, _OK, _ERR, _WARN, _INFO
+    if _colors is None:
+        from colorama import Fore, Style, init
+
+        # Initialize colorama for Windows
+        init(autoreset=True)
+        _colors = (Fore, Style)
+        _OK = f"{Fore.GREEN}✓{Style.RESET_ALL} "
+        _ERR = f"{Fore.RED}✗{Style.RESET_ALL} "
+        _WARN = f"{Fore.YELLOW}⚠{Style.RESET_ALL} "
+        _INFO = f"{Fore.CYAN}ℹ{Style.RESET_ALL} "
+    return _colors
+
+
+def _write(text: str, use_tqdm: bool):
+    """Write a line to stdout, routing through tqdm when a bar is active."""
+    if use_tqdm:
+        from tqdm import tqdm
+
+        tqdm.write(text)
+    else:
+        print(text)
 
 
 def print_banner():
     """Print the tool banner."""
+    Fore, Style = _init_colors()
     banner = f"""
 {Fore.CYAN}╔══════════════════════════════════════════════════════════════════════╗
 ║                            HTML2MD v{__version__}                            ║
@@ -38,38 +73,38 @@ Examples:
 
 def print_success(message: str, use_tqdm: bool = False):
     """Print a success message."""
-    text = f"{Fore.GREEN}✓{Style.RESET_ALL} {message}"
-    if use_tqdm:
-        tqdm.write(text)
-    else:
-        print(text)
+    _init_colors()
+    _write(_OK + message, use_tqdm)
 
 
 def print_error(message: str, use_tqdm: bool = False):
     """Print an error message."""
-    text = f"{Fore.RED}✗{Style.RESET_ALL} {message}"
-    if use_tqdm:
-        tqdm.write(text)
-    else:
-        print(text)
+    _init_colors()
+    _write(_ERR + message, use_tqdm)
 
 
 def print_warning(message: str, use_tqdm: bool = False):
     """Print a warning message."""
-    text = f"{Fore.YELLOW}⚠{Style.RESET_ALL} {message}"
-    if use_tqdm:
-        tqdm.write(text)
-    else:
-        print(text)
+    _init_colors()
+    _write(_WARN + message, use_tqdm)
+
+
+def print_warnings(messages: Iterable[str]):
+    """Print several warning messages with a single write."""
+    _init_colors()
+    sys.stdout.write("".join(f"{_WARN}{message}\n" for message in messages))
+
+
+def print_errors(messages: Iterable[str]):
+    """Print several error messages with a single write."""
+    _init_colors()
+    sys.stdout.write("".join(f"{_ERR}{message}\n" for message in messages))
 
 
 def print_info(message: str, use_tqdm: bool = False):
     """Print an info message."""
-    text = f"{Fore.CYAN}ℹ{Style.RESET_ALL} {message}"
-    if use_tqdm:
-        tqdm.write(text)
-    else:
-        print(text)
+    _init_colors()
+    _write(_INFO + message, use_tqdm)
 
 
 @click.command()
@@ -167,7 +202,14 @@ def print_info(message: str, use_tqdm: bool = False):
 @click.option(
     "--wrap-width", type=int, default=80, help="Text wrap width (default: 80)"
 )
-@click.version_option(version=__version__)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of worker processes (default: number of CPUs)",
+)
+@click.version_option(__version__, "--version", "-V")
 def main(
     path: Optional[str],
     output: Optional[str],
@@ -196,6 +238,7 @@ def main(
     parser: str,
     wrap: bool,
     wrap_width: int,
+    jobs: Optional[int],
 ):
     """Convert HTML files to Markdown.
 
@@ -219,6 +262,9 @@ def main(
         print_error("--overwrite and --output are mutually exclusive")
         sys.exit(1)
 
+    from .converter import HTMLToMarkdownConverter
+    from .processor import ConflictResolver, FileProcessor
+
     # Create converter with options
     converter = HTMLToMarkdownConverter(
         extract_metadata=not no_extract_metadata,
@@ -246,7 +292,7 @@ def main(
     input_path = Path(path)
     output_path = Path(output) if output else None
 
-    html_files = processor.find_html_files(input_path, recursive=recursive)
+    html_files = list(processor.find_html_files(input_path, recursive=recursive))
     if not html_files:
         print_error(f"No HTML files found in: {input_path}")
         sys.exit(1)
@@ -262,6 +308,7 @@ def main(
         base_input_dir = input_path
 
     # Generate file mapping
+    base_prefix = processor.base_prefix(base_input_dir)
     file_mapping = {}
     for html_file in html_files:
         output_file = processor.generate_output_path(
@@ -270,11 +317,14 @@ def main(
             output_path,
             flatten=flatten,
             rename_conflicts=False,  # We'll handle conflicts separately
+            base_prefix=base_prefix,
         )
         file_mapping[html_file] = output_file
 
-    # Handle conflicts if outputting to a directory
-    if output_path and (flatten or len(html_files) > 1):
+    # Handle conflicts if outputting to a directory, or when --overwrite
+    # converts in place: colliding outputs (e.g. a.html and a.htm -> a.md)
+    # would overwrite each other and both originals would then be removed
+    if len(html_files) > 1 and (output_path or overwrite):
         clean_mapping, conflicts = processor.check_conflicts(file_mapping)
 
         if conflicts:
@@ -284,7 +334,7 @@ def main(
                     use_tqdm=False,
                 )
 
-            if rename:
+            if rename and output_path:
                 if verbose:
                     print_info("Resolving conflicts by renaming...", use_tqdm=False)
                 resolved = ConflictResolver.resolve_with_rename(
@@ -297,50 +347,70 @@ def main(
                 file_mapping = ConflictResolver.filter_conflicts(
                     conflicts, file_mapping
                 )
-                for conflict in conflicts:
-                    print_warning(
-                        f"Skipping conflicted file: {conflict}", use_tqdm=False
-                    )
+                print_warnings(
+                    f"Skipping conflicted file: {conflict}" for conflict in conflicts
+                )
             else:
+                # Renaming needs an output directory to place the files in
+                resolve_hint = "--rename or --skip" if output_path else "--skip"
                 print_error(
-                    f"Found {len(conflicts)} naming conflicts. Use --rename or --skip to resolve.",
+                    f"Found {len(conflicts)} naming conflicts. Use {resolve_hint} to resolve.",
                     use_tqdm=False,
                 )
                 if verbose:
-                    for conflict in conflicts:
-                        print_error(f"  Conflict: {conflict}", use_tqdm=False)
+                    print_errors(f"  Conflict: {conflict}" for conflict in conflicts)
                 sys.exit(1)
 
     # Show what will be done in dry-run mode
     if dry_run:
         print_info("DRY RUN - No files will be converted:")
-        for input_file, output_file in file_mapping.items():
+        for input_file, output_file in sorted(file_mapping.items()):
             print(f"  {input_file} -> {output_file}")
         return
 
     # Convert files
     success_count = 0
     error_count = 0
+    successful_inputs = []
     use_tqdm_output = len(file_mapping) > 1 and not no_progress_bar
 
+    # Convert in worker processes when there is more than one file
+    workers = _worker_count(jobs, len(file_mapping))
+    if workers > 1:
+        results = _convert_parallel(
+            converter.config, file_mapping, workers, overwrite, dry_run
+        )
+    else:
+        results = (
+            (
+                input_file,
+                *processor.process_single_file(
+                    input_file, output_file, overwrite=overwrite, dry_run=dry_run
+                ),
+            )
+            for input_file, output_file in file_mapping.items()
+        )
+
     # Use progress bar for multiple files
     if len(file_mapping) > 1:
-        file_iter = tqdm(
-            file_mapping.items(),
+        from tqdm import tqdm
+
+        results = tqdm(
+            results,
+            total=len(file_mapping),
             desc="Converting files",
             unit="file",
             disable=no_progress_bar,
-        )
-    else:
-        file_iter = file_mapping.items()
-
-    for input_file, output_file in file_iter:
-        success, message = processor.process_single_file(
-            input_file, output_file, overwrite=overwrite, dry_run=dry_run
+            # Redraw at most ~200 times per run and no more than 10x/second
+            mininterval=0.1,
+            miniters=max(1, len(file_mapping) // 200),
+            smoothing=0.0,
         )
 
+    for input_file, success, message in results:
         if success:
             success_count += 1
+            successful_inputs.append(input_file)
             if verbose:
                 print_success(message, use_tqdm=use_tqdm_output)
         else:
@@ -348,15 +418,7 @@ def main(
             print_error(message, use_tqdm=use_tqdm_output)
 
     # Remove original files if requested
-    if overwrite and not dry_run and success_count > 0:
-        successful_inputs = [
-            input_file
-            for input_file, output_file in file_mapping.items()
-            if processor.process_single_file(
-                input_file, output_file, overwrite=False, dry_run=True
-            )[0]
-        ]
-
+    if overwrite and not dry_run and successful_inputs:
         _remove_original_files(successful_inputs, dry_run)
 
     # Summary
@@ -375,6 +437,95 @@ def main(
     sys.exit(0 if error_count == 0 else 1)
 
 
+# ProcessPoolExecutor rejects more workers than this on Windows
+_WINDOWS_MAX_WORKERS = 61
+
+
+def _worker_count(jobs: Optional[int], file_count: int) -> int:
+    """Decide how many worker processes to start.
+
+    Args:
+        jobs: Value of --jobs, or None to use the number of CPUs
+        file_count: Number of files to convert
+
+    Returns:
+        Number of workers, never more than there are files
+    """
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    if sys.platform == "win32":
+        jobs = min(jobs, _WINDOWS_MAX_WORKERS)
+    return max(1, min(jobs, file_count))
+
+
+# Per-process FileProcessor, set up once by _init_worker in each pool worker
+_worker_processor: Optional["FileProcessor"] = None
+
+
+def _init_worker(config):
+    """Build the worker's converter from the shared configuration.
+
+    Args:
+        config: Converter configuration dict
+    """
+    global _worker_processor
+    from .converter import HTMLToMarkdownConverter
+    from .processor import FileProcessor
+
+    _worker_processor = FileProcessor(HTMLToMarkdownConverter(**config))
+
+
+def _convert_one(input_file, output_file, overwrite: bool, dry_run: bool):
+    """Convert a single file in a worker process.
+
+    Args:
+        input_file: Input HTML file path
+        output_file: Output Markdown file path
+        overwrite: Whether to overwrite existing files
+        dry_run: Whether to perform a dry run
+
+    Returns:
+        Tuple of (success, message)
+    """
+    assert _worker_processor is not None, "worker not initialized"
+    return _worker_processor.process_single_file(
+        input_file, output_file, overwrite=overwrite, dry_run=dry_run
+    )
+
+
+def _convert_parallel(config, file_mapping, jobs: int, overwrite: bool, dry_run: bool):
+    """Convert files across a pool of worker processes.
+
+    The converter configuration is sent once per worker through the pool
+    initializer, so each task only carries its two paths.
+
+    Args:
+        config: Converter configuration dict
+        file_mapping: Mapping of input paths to output paths
+        jobs: Number of worker processes
+        overwrite: Whether to overwrite existing files
+        dry_run: Whether to perform a dry run
+
+    Yields:
+        Tuples of (input file, success, message) in input order
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from functools import partial
+
+    input_files = list(file_mapping)
+    chunksize = max(1, len(input_files) // (4 * jobs))
+    convert = partial(_convert_one, overwrite=overwrite, dry_run=dry_run)
+
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_worker, initargs=(config,)
+    ) as executor:
+        results = executor.map(
+            convert, input_files, file_mapping.values(), chunksize=chunksize
+        )
+        for input_file, (success, message) in zip(input_files, results):
+            yield input_file, success, message
+
+
 def _remove_original_files(file_paths, dry_run: bool):
     """Remove original HTML files after successful conversion.
 
@@ -1,5 +1,6 @@
 """Core conversion functionality for HTML to Markdown."""
 
+import functools
 import re
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union, Literal, Callable, Any
@@ -70,6 +71,25 @@ class HTMLToMarkdownConverter:
             "stream_processing": stream_processing,
             "chunk_size": chunk_size,
         }
+        # Bind the options once rather than unpacking them on every call
+        self._convert: Callable[..., str] = functools.partial(
+            convert_to_markdown, **self.config
+        )
+
+    @staticmethod
+    def from_options(**options: Any) -> "HTMLToMarkdownConverter":
+        """Get a converter for the given options, reusing a cached instance.
+
+        Converters built with the same options are shared, so callers must
+        not modify the returned converter's config.
+
+        Args:
+            **options: Keyword arguments accepted by the constructor
+
+        Returns:
+            HTMLToMarkdownConverter configured with the given options
+        """
+        return _cached_converter(tuple(sorted(options.items())))
 
     def convert_html_to_markdown(self, html_content: str) -> str:
         """Convert HTML content to Markdown using html-to-markdown.
@@ -82,7 +102,7 @@ class HTMLToMarkdownConverter:
         """
         try:
             # Use the html-to-markdown library with our configuration
-            markdown = convert_to_markdown(html_content, **self.config)
+            markdown = self._convert(html_content)
 
             # Additional post-processing if needed
             markdown = self.postprocess_markdown(markdown)
@@ -102,11 +122,9 @@ class HTMLToMarkdownConverter:
             Cleaned markdown content
         """
         # The html-to-markdown library already does most cleanup,
-        # but we can add any additional custom processing here
-
-        # Ensure file ends with single newline
-        if markdown_content and not markdown_content.endswith("\n"):
-            markdown_content += "\n"
+        # but we can add any additional custom processing here.
+        # The trailing newline is added by convert_file at write time to
+        # avoid copying the whole document just to append one character.
 
         return markdown_content
 
@@ -142,27 +160,36 @@ class HTMLToMarkdownConverter:
 
         # Read HTML content
         try:
-            with open(input_path, "r", encoding=encoding, errors="replace") as f:
-                html_content = f.read()
+            html_content = input_path.read_bytes().decode(encoding, "replace")
         except Exception as e:
             raise FileReadError(f"Failed to read file {input_path}: {str(e)}")
 
-        # Convert to markdown
-        markdown_content = self.convert_html_to_markdown(html_content)
-
         # Ensure output directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # Convert to markdown
+        markdown_content = self.convert_html_to_markdown(html_content)
+
         # Write markdown content
         try:
-            with open(output_path, "w", encoding=encoding, errors="replace") as f:
-                f.write(markdown_content)
+            data = markdown_content.encode(encoding, "replace")
+            with open(output_path, "wb") as f:
+                f.write(data)
+                # Ensure file ends with a newline
+                if data and not data.endswith(b"\n"):
+                    f.write(b"\n")
         except Exception as e:
             raise FileWriteError(f"Failed to write file {output_path}: {str(e)}")
 
         return str(output_path)
 
 
+@functools.lru_cache(maxsize=8)
+def _cached_converter(options: Tuple[Tuple[str, Any], ...]) -> HTMLToMarkdownConverter:
+    """Build a converter for HTMLToMarkdownConverter.from_options."""
+    return HTMLToMarkdownConverter(**dict(options))
+
+
 class ConversionError(Exception):
     """Exception raised when HTML to Markdown conversion fails."""
 
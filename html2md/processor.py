@@ -3,10 +3,21 @@
 import os
 import shutil
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple, Union
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
 
 from .converter import HTMLToMarkdownConverter
 
+_HTML_SUFFIXES = (".html", ".htm")
+
+
+def _has_html_suffix(name: str) -> bool:
+    """Check a file name for an HTML extension, ignoring case.
+
+    Only the last five characters are lower-cased, and only when the name
+    does not already end in a lower-case extension.
+    """
+    return name.endswith(_HTML_SUFFIXES) or name[-5:].lower().endswith(_HTML_SUFFIXES)
+
 
 class FileProcessor:
     """Handles file and directory operations for HTML to Markdown conversion."""
@@ -21,30 +32,54 @@ class FileProcessor:
 
     def find_html_files(
         self, path: Union[str, Path], recursive: bool = True
-    ) -> List[Path]:
+    ) -> Iterator[Path]:
         """Find all HTML files in a path.
 
+        Files are yielded lazily in filesystem order; sort the result if a
+        stable order is needed.
+
         Args:
             path: Directory or file path to search
             recursive: Whether to search recursively
 
         Returns:
-            List of HTML file paths
+            Iterator over HTML file paths
         """
         path = Path(path)
-        html_files = []
 
         if path.is_file():
-            if self._is_html_file(path):
-                html_files.append(path)
-        elif path.is_dir():
-            pattern = "**/*.html" if recursive else "*.html"
-            html_files.extend(path.glob(pattern))
-            # Also check for .htm files
-            pattern = "**/*.htm" if recursive else "*.htm"
-            html_files.extend(path.glob(pattern))
+            return iter([path] if self._is_html_file(path) else [])
+        if path.is_dir():
+            return self._walk_html_files(path, recursive)
+        return iter([])
 
-        return sorted(html_files)
+    def _walk_html_files(
+        self, directory: Union[str, Path], recursive: bool
+    ) -> Iterator[Path]:
+        """Yield HTML files under a directory in a single scandir pass.
+
+        Args:
+            directory: Directory to scan
+            recursive: Whether to descend into subdirectories
+
+        Yields:
+            Paths of HTML files
+        """
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            # Skip unreadable directories, as Path.glob did
+            return
+
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        yield from self._walk_html_files(entry.path, recursive)
+                elif _has_html_suffix(entry.name):
+                    # Anything that is not a directory is a candidate, so
+                    # no is_file() call (and possible stat) is needed.
+                    yield Path(entry.path)
 
     def _is_html_file(self, file_path: Path) -> bool:
         """Check if a file is an HTML file.
@@ -55,7 +90,23 @@ class FileProcessor:
         Returns:
             True if file is HTML
         """
-        return file_path.suffix.lower() in [".html", ".htm"]
+        return _has_html_suffix(file_path.name)
+
+    @staticmethod
+    def base_prefix(base_input_dir: Path) -> str:
+        """Get the string prefix shared by paths under a base directory.
+
+        Args:
+            base_input_dir: Base directory for input files
+
+        Returns:
+            Prefix to strip from input paths to make them relative
+        """
+        base = str(base_input_dir)
+        if base == ".":
+            # Paths under the current directory are stored without "./"
+            return ""
+        return base.rstrip(os.sep) + os.sep
 
     def generate_output_path(
         self,
@@ -64,6 +115,7 @@ class FileProcessor:
         output_dir: Optional[Path] = None,
         flatten: bool = False,
         rename_conflicts: bool = False,
+        base_prefix: Optional[str] = None,
     ) -> Path:
         """Generate output path for converted file.
 
@@ -73,12 +125,15 @@ class FileProcessor:
             output_dir: Output directory (None to convert in place)
             flatten: Whether to flatten directory structure
             rename_conflicts: Whether to rename conflicting files
+            base_prefix: Precomputed base_prefix(base_input_dir), for callers
+                mapping many files under the same base
 
         Returns:
             Output path for Markdown file
         """
         # Change extension to .md
-        md_filename = input_path.stem + ".md"
+        stem = input_path.stem
+        md_filename = stem + ".md"
 
         if output_dir is None:
             # Convert in place
@@ -86,28 +141,55 @@ class FileProcessor:
 
         output_dir = Path(output_dir)
 
-        if flatten:
+        if flatten and not rename_conflicts:
             # Flatten structure - all files go to output_dir root
-            if rename_conflicts:
-                # Create hierarchical name: folder_subfolder_filename.md
-                try:
-                    relative_path = input_path.relative_to(base_input_dir)
-                    parts = list(relative_path.parent.parts) + [input_path.stem]
-                    flat_name = "_".join(parts) + ".md"
-                    return output_dir / flat_name
-                except ValueError:
-                    # If relative_to fails, just use filename
-                    return output_dir / md_filename
-            else:
-                return output_dir / md_filename
-        else:
-            # Preserve directory structure
-            try:
-                relative_path = input_path.relative_to(base_input_dir)
-                return output_dir / relative_path.parent / md_filename
-            except ValueError:
-                # If relative_to fails, put in output_dir root
-                return output_dir / md_filename
+            return output_dir / md_filename
+
+        relative_parent = self._relative_parent(input_path, base_input_dir, base_prefix)
+        if relative_parent is None:
+            # Not under base_input_dir, put in output_dir root
+            return output_dir / md_filename
+
+        if flatten:
+            # Create hierarchical name: folder_subfolder_filename.md
+            if relative_parent:
+                stem = relative_parent.replace(os.sep, "_") + "_" + stem
+            return output_dir / (stem + ".md")
+
+        # Preserve directory structure
+        if relative_parent:
+            return output_dir / relative_parent / md_filename
+        return output_dir / md_filename
+
+    def _relative_parent(
+        self, input_path: Path, base_input_dir: Path, base_prefix: Optional[str]
+    ) -> Optional[str]:
+        """Get the parent directory of a file relative to the base directory.
+
+        Args:
+            input_path: Original HTML file path
+            base_input_dir: Base directory for input files
+            base_prefix: Precomputed base_prefix(base_input_dir), or None
+
+        Returns:
+            Relative parent as a string ("" for the base itself), or None if
+            input_path is not under base_input_dir
+        """
+        if base_prefix is None:
+            base_prefix = self.base_prefix(base_input_dir)
+
+        input_str = str(input_path)
+        if input_str.startswith(base_prefix) and (
+            base_prefix or not input_path.is_absolute()
+        ):
+            # Fast path: plain string slicing instead of relative_to()
+            return input_str[len(base_prefix) :].rpartition(os.sep)[0]
+
+        try:
+            parent = input_path.relative_to(base_input_dir).parent
+        except ValueError:
+            return None
+        return "" if parent == Path(".") else str(parent)
 
     def check_conflicts(
         self, file_mapping: Dict[Path, Path]
@@ -120,23 +202,29 @@ class FileProcessor:
         Returns:
             Tuple of (conflict-free mapping, conflicted paths)
         """
-        output_counts: Dict[Path, List[Path]] = {}
-
-        # Group input files by output path
-        for input_path, output_path in file_mapping.items():
-            if output_path not in output_counts:
-                output_counts[output_path] = []
-            output_counts[output_path].append(input_path)
-
-        # Find conflicts
-        conflicts = set()
-        clean_mapping = {}
+        seen_outputs: Set[Path] = set()
+        duplicate_outputs: Set[Path] = set()
 
-        for output_path, input_paths in output_counts.items():
-            if len(input_paths) == 1:
-                clean_mapping[input_paths[0]] = output_path
+        # Find output paths claimed by more than one input
+        for output_path in file_mapping.values():
+            if output_path in seen_outputs:
+                duplicate_outputs.add(output_path)
             else:
-                conflicts.update(input_paths)
+                seen_outputs.add(output_path)
+
+        if not duplicate_outputs:
+            return dict(file_mapping), set()
+
+        conflicts = {
+            input_path
+            for input_path, output_path in file_mapping.items()
+            if output_path in duplicate_outputs
+        }
+        clean_mapping = {
+            input_path: output_path
+            for input_path, output_path in file_mapping.items()
+            if output_path not in duplicate_outputs
+        }
 
         return clean_mapping, conflicts
 
@@ -158,7 +246,7 @@ class FileProcessor:
         Returns:
             Tuple of (success, message)
         """
-        if output_file.exists() and not overwrite:
+        if not overwrite and output_file.exists():
             return False, f"Output file exists: {output_file}"
 
         if dry_run:
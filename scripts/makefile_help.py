@@ -4,93 +4,127 @@ Platform-agnostic script to display Makefile help messages.
 This replaces the grep-based help functionality in the Makefile for Windows compatibility.
 """
 
+import functools
+import mmap
+import operator
 import os
 import re
 import sys
 from pathlib import Path
 
+# Pattern to match lines like: "target: ## Description". The prefix only
+# consumes characters that cannot start "##", so it never backtracks.
+_HELP_RE = re.compile(
+    rb'^[ \t]*([a-zA-Z_-]+):(?:[^#\n]|#(?!#))*##[ \t]*([^\n]*)', re.MULTILINE
+)
 
-def find_makefile():
-    """Find the Makefile in the current directory or parent directories."""
-    current_dir = Path.cwd()
-    
-    # Look for Makefile in current directory first
-    makefile_paths = [
-        current_dir / "Makefile",
-        current_dir / "makefile",
-        current_dir / "GNUmakefile"
-    ]
-    
-    for makefile_path in makefile_paths:
-        if makefile_path.exists():
-            return makefile_path
-    
-    # If not found, look in parent directories up to 3 levels
-    for i in range(3):
-        current_dir = current_dir.parent
-        for makefile_name in ["Makefile", "makefile", "GNUmakefile"]:
-            makefile_path = current_dir / makefile_name
-            if makefile_path.exists():
-                return makefile_path
+
+_MAKEFILE_NAMES = ("Makefile", "makefile", "GNUmakefile")
+
+
+@functools.lru_cache(maxsize=8)
+def find_makefile(start_dir):
+    """Find the Makefile in start_dir or up to 3 parent directories."""
+    # Look in the start directory first, then its parents
+    for directory in (start_dir, *list(start_dir.parents)[:3]):
+        # One directory listing instead of a stat per candidate name
+        try:
+            with os.scandir(directory) as entries:
+                names = {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            continue
+        
+        for makefile_name in _MAKEFILE_NAMES:
+            if makefile_name in names:
+                return directory / makefile_name
     
     return None
 
 
+def _iter_help(makefile_path):
+    """Yield (target, description) pairs from the Makefile as they are found."""
+    with open(makefile_path, 'rb') as f:
+        # Empty files cannot be memory-mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for match in _HELP_RE.finditer(mm):
+                description = match.group(2).rstrip().decode('utf-8')
+                yield match.group(1).decode('ascii'), description
+
+
 def extract_help_messages(makefile_path):
-    """Extract help messages from the Makefile."""
+    """Extract help messages and the longest target name length from the Makefile."""
     help_messages = []
+    max_target_width = 0
     
     try:
-        with open(makefile_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+        for target, description in _iter_help(makefile_path):
+            help_messages.append((target, description))
+            if len(target) > max_target_width:
+                max_target_width = len(target)
     except Exception as e:
         print(f"Error reading Makefile: {e}", file=sys.stderr)
-        return []
+        return [], 0
     
-    # Pattern to match lines like: "target: ## Description"
-    pattern = re.compile(r'^([a-zA-Z_-]+):.*?##\s*(.*)$')
+    return help_messages, max_target_width
+
+
+def _write_stdout(text):
+    """Write text to stdout, as raw bytes when it is not a terminal."""
+    # On Windows the text layer translates newlines and may use a code page
+    # other than UTF-8, so raw bytes would not match the rest of the output
+    if sys.stdout.isatty() or sys.platform == 'win32':
+        sys.stdout.write(text)
+        return
     
-    for line in lines:
-        line = line.strip()
-        match = pattern.match(line)
-        if match:
-            target = match.group(1)
-            description = match.group(2)
-            help_messages.append((target, description))
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, ValueError):
+        # Not backed by a file descriptor (e.g. captured output)
+        sys.stdout.write(text)
+        return
     
-    return help_messages
+    # Flush earlier print() output first so ordering is preserved
+    sys.stdout.flush()
+    data = memoryview(text.encode(sys.stdout.encoding or 'utf-8', 'replace'))
+    while data:
+        data = data[os.write(fd, data):]
 
 
-def display_help(help_messages):
+def display_help(help_messages, max_target_width=None):
     """Display the help messages in a formatted way."""
     if not help_messages:
         print("No help messages found in Makefile")
         return
     
-    print("Available targets:")
-    
-    # Calculate the maximum width for target names for proper alignment
-    max_target_width = max(len(target) for target, _ in help_messages) if help_messages else 0
+    if max_target_width is None:
+        max_target_width = max(len(target) for target, _ in help_messages)
     max_target_width = max(max_target_width, 15)  # Minimum width of 15
     
     # Sort targets alphabetically
-    help_messages.sort(key=lambda x: x[0])
+    help_messages.sort(key=operator.itemgetter(0))
     
-    for target, description in help_messages:
-        print(f"  {target:<{max_target_width}} {description}")
+    # Build the whole table and write it at once
+    lines = ["Available targets:"]
+    lines.extend(
+        f"  {target:<{max_target_width}} {description}"
+        for target, description in help_messages
+    )
+    _write_stdout("\n".join(lines) + "\n")
 
 
 def main():
     """Main function to find Makefile and display help."""
-    makefile_path = find_makefile()
+    makefile_path = find_makefile(Path.cwd())
     
     if not makefile_path:
         print("Error: No Makefile found in current directory or parent directories", file=sys.stderr)
         sys.exit(1)
     
     print(f"Reading help from: {makefile_path}")
-    help_messages = extract_help_messages(makefile_path)
-    display_help(help_messages)
+    help_messages, max_target_width = extract_help_messages(makefile_path)
+    display_help(help_messages, max_target_width)
 
 
 if __name__ == "__main__":
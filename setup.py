@@ -1,58 +1,67 @@
 """Setup configuration for html2md package."""
 
-from setuptools import setup, find_packages
+from setuptools import setup
 from pathlib import Path
 
-# Read README file
-readme_file = Path(__file__).parent / "README.md"
-long_description = (
-    readme_file.read_text(encoding="utf-8") if readme_file.exists() else ""
-)
-
-# Read requirements
-requirements_file = Path(__file__).parent / "requirements.txt"
-requirements = []
-if requirements_file.exists():
-    requirements = requirements_file.read_text().strip().split("\n")
-    requirements = [
-        req.strip() for req in requirements if req.strip() and not req.startswith("#")
-    ]
-
-setup(
-    name="html2md",
-    version="1.0.0",
-    description="A fast CLI tool for converting HTML files to Markdown",
-    long_description=long_description,
-    long_description_content_type="text/markdown",
-    author="Your Name",
-    author_email="your.email@example.com",
-    url="https://github.com/yourusername/html2md",
-    packages=find_packages(),
-    install_requires=requirements,
-    entry_points={
-        "console_scripts": [
-            "html2md=html2md.cli:main",
+HERE = Path(__file__).resolve().parent
+
+
+def _load_meta():
+    """Read the long description and requirements for setup()."""
+    # Read README file
+    try:
+        long_description = (HERE / "README.md").read_text(encoding="utf-8")
+    except FileNotFoundError:
+        long_description = ""
+
+    # Read requirements
+    try:
+        requirements = [
+            line.strip().decode("utf-8")
+            for line in (HERE / "requirements.txt").read_bytes().splitlines()
+            if line.strip() and not line.startswith(b"#")
+        ]
+    except FileNotFoundError:
+        requirements = []
+
+    return {"long_description": long_description, "install_requires": requirements}
+
+
+if __name__ == "__main__":
+    setup(
+        name="html2md",
+        version="1.0.0",
+        description="A fast CLI tool for converting HTML files to Markdown",
+        long_description_content_type="text/markdown",
+        **_load_meta(),
+        author="Your Name",
+        author_email="your.email@example.com",
+        url="https://github.com/yourusername/html2md",
+        packages=["html2md"],
+        entry_points={
+            "console_scripts": [
+                "html2md=html2md.__main__:main",
+            ],
+        },
+        python_requires=">=3.7",
+        classifiers=[
+            "Development Status :: 4 - Beta",
+            "Intended Audience :: Developers",
+            "License :: OSI Approved :: MIT License",
+            "Programming Language :: Python :: 3",
+            "Programming Language :: Python :: 3.7",
+            "Programming Language :: Python :: 3.8",
+            "Programming Language :: Python :: 3.9",
+            "Programming Language :: Python :: 3.10",
+            "Programming Language :: Python :: 3.11",
+            "Operating System :: OS Independent",
+            "Topic :: Text Processing :: Markup :: HTML",
+            "Topic :: Text Processing :: Markup :: Markdown",
+            "Topic :: Utilities",
         ],
-    },
-    python_requires=">=3.7",
-    classifiers=[
-        "Development Status :: 4 - Beta",
-        "Intended Audience :: Developers",
-        "License :: OSI Approved :: MIT License",
-        "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.7",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
-        "Programming Language :: Python :: 3.11",
-        "Operating System :: OS Independent",
-        "Topic :: Text Processing :: Markup :: HTML",
-        "Topic :: Text Processing :: Markup :: Markdown",
-        "Topic :: Utilities",
-    ],
-    keywords="html markdown converter cli tool",
-    project_urls={
-        "Bug Reports": "https://github.com/yourusername/html2md/issues",
-        "Source": "https://github.com/yourusername/html2md",
-    },
-)
+        keywords="html markdown converter cli tool",
+        project_urls={
+            "Bug Reports": "https://github.com/yourusername/html2md/issues",
+            "Source": "https://github.com/yourusername/html2md",
+        },
+    )
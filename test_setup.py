@@ -3,6 +3,8 @@
 
 import tempfile
 import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Sample HTML content for testing
@@ -104,47 +106,48 @@ COMPLEX_HTML = """<!DOCTYPE html>
 </html>"""
 
 
-def create_test_structure():
-    """Create a test directory structure with HTML files."""
-    # Create temporary directory
-    test_dir = Path(tempfile.mkdtemp(prefix="html2md_test_"))
-
-    # Create directory structure
-    (test_dir / "docs").mkdir()
-    (test_dir / "docs" / "guides").mkdir()
-    (test_dir / "examples").mkdir()
-
-    # Create HTML files
-    files_created = []
+# Encoded test documents, built once at import
+SAMPLE_HTML_BYTES = SAMPLE_HTML.encode("utf-8")
+COMPLEX_HTML_BYTES = COMPLEX_HTML.encode("utf-8")
+_OVERVIEW = SAMPLE_HTML.replace("Test Document", "Overview").encode("utf-8")
+_BASIC = SAMPLE_HTML.replace("Test Document", "Basic Example").encode("utf-8")
+_GETTING_STARTED = COMPLEX_HTML.replace(
+    "Complex Document", "Getting Started Guide"
+).encode("utf-8")
+_ADVANCED = COMPLEX_HTML.replace("Complex Document", "Advanced Example").encode("utf-8")
 
-    # Root level files
-    (test_dir / "index.html").write_text(SAMPLE_HTML)
-    files_created.append("index.html")
+# Test files as (relative path, content)
+TEST_FILES = [
+    ("index.html", SAMPLE_HTML_BYTES),
+    ("about.html", COMPLEX_HTML_BYTES),
+    ("docs/overview.html", _OVERVIEW),
+    ("docs/guides/getting-started.html", _GETTING_STARTED),
+    ("examples/basic.html", _BASIC),
+    ("examples/advanced.html", _ADVANCED),
+]
 
-    (test_dir / "about.html").write_text(COMPLEX_HTML)
-    files_created.append("about.html")
 
-    # Docs directory
-    (test_dir / "docs" / "overview.html").write_text(
-        SAMPLE_HTML.replace("Test Document", "Overview")
-    )
-    files_created.append("docs/overview.html")
+def _write_test_file(test_dir, relative_path, content):
+    """Write a single test HTML file, creating its parent directories."""
+    file_path = test_dir / relative_path
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_path.write_bytes(content)
 
-    (test_dir / "docs" / "guides" / "getting-started.html").write_text(
-        COMPLEX_HTML.replace("Complex Document", "Getting Started Guide")
-    )
-    files_created.append("docs/guides/getting-started.html")
 
-    # Examples directory
-    (test_dir / "examples" / "basic.html").write_text(
-        SAMPLE_HTML.replace("Test Document", "Basic Example")
-    )
-    files_created.append("examples/basic.html")
+def create_test_structure():
+    """Create a test directory structure with HTML files."""
+    # Create temporary directory
+    test_dir = Path(tempfile.mkdtemp(prefix="html2md_test_"))
 
-    (test_dir / "examples" / "advanced.html").write_text(
-        COMPLEX_HTML.replace("Complex Document", "Advanced Example")
-    )
-    files_created.append("examples/advanced.html")
+    # Create HTML files, overlapping the writes
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(
+            executor.map(
+                lambda job: _write_test_file(test_dir, *job),
+                TEST_FILES,
+            )
+        )
+    files_created = [relative_path for relative_path, _ in TEST_FILES]
 
     print(f"Created test directory: {test_dir}")
     print(f"Files created: {len(files_created)}")
@@ -156,8 +159,28 @@ def create_test_structure():
 
 def cleanup_test_structure(test_dir):
     """Clean up test directory."""
-    if test_dir.exists():
-        shutil.rmtree(test_dir)
+    failures = []
+
+    def record_failure(func, path, exc):
+        """Record a removal error and let rmtree continue."""
+        failures.append((path, exc))
+
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(test_dir, onexc=record_failure)
+    else:
+        # onerror passes the exception as an exc_info tuple
+        shutil.rmtree(
+            test_dir,
+            onerror=lambda func, path, exc_info: record_failure(
+                func, path, exc_info[1]
+            ),
+        )
+
+    if failures:
+        print(f"Failed to clean up test directory: {test_dir}")
+        for path, error in failures:
+            print(f"  - {path}: {error}")
+    else:
         print(f"Cleaned up test directory: {test_dir}")
 
 
@@ -174,8 +197,6 @@ if __name__ == "__main__":
     print("When done testing, run this script with 'cleanup' to remove test files:")
     print(f"python test_setup.py cleanup {test_dir}")
 
-    import sys
-
     if len(sys.argv) > 1 and sys.argv[1] == "cleanup":
         if len(sys.argv) > 2:
             cleanup_dir = Path(sys.argv[2])